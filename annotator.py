@@ -100,10 +100,17 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(self.image_controller.get_image_status())
         self.canvas.load_image(image_path)
 
+        # Let the queued save of the outgoing image land before reading
+        # annotations, or revisiting an image could show stale data
+        self.canvas.wait_for_save()
+
         anno_info = self.annotation_controller.load_annotations(image_name)
         self.canvas.load_annotations(anno_info['annotations'])
         self.annotation_list.redraw_widgets()
 
+        for neighbor_path in self.image_controller.get_neighbor_paths():
+            self.canvas.prefetch_image(neighbor_path)
+
     def open_dir(self, dir_path: str) -> None:
         self.image_controller.load_images(dir_path)
         self.canvas.reset()
@@ -192,6 +199,7 @@ class MainWindow(QMainWindow):
 
     def export_annotations(self, output_path: str) -> None:
         self.canvas.save_progress()
+        self.canvas.wait_for_save()
 
         self.annotation_controller.export_annotations(output_path)
         self.reload()
@@ -237,6 +245,7 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event: QCloseEvent) -> None:
         self.canvas.save_progress()
+        self.canvas.wait_for_save()
 
         if not self.annotation_controller.has_annotations():
             return
@@ -2,10 +2,11 @@ import copy
 import os
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import Qt, QTimer, QPoint
+from PyQt6.QtCore import Qt, QTimer, QPoint, QRunnable, QThreadPool
 from PyQt6.QtGui import (
-    QImageReader,
+    QImage,
     QPixmap,
+    QPixmapCache,
     QMouseEvent,
     QWheelEvent,
     QKeyEvent,
@@ -35,7 +36,9 @@ from app.handlers.annotator import KeypointAnnotator
 from app.handlers.keyboard import KeyboardHandler
 from app.handlers.mouse import MouseHandler
 from app.handlers.painter import CanvasPainter
+from app.handlers.spatial import HoverIndex
 from app.handlers.image.brightness import BrightnessHandler
+from app.handlers.image.loader import ImageLoader
 from app.handlers.image.zoom import ZoomHandler
 from app.widgets.combo_box import AnnotationComboBox, ImageComboBox
 from app.widgets.context_menu import AnnotationContextMenu, CanvasContextMenu
@@ -44,6 +47,44 @@ from app.utils import clip_value
 
 if TYPE_CHECKING:
     from annotator import MainWindow
+    from app.controllers.annotation_controller import AnnotationController
+
+__hover_cursors__ = {
+    HoverType.TOP: Qt.CursorShape.SizeVerCursor,
+    HoverType.BOTTOM: Qt.CursorShape.SizeVerCursor,
+    HoverType.LEFT: Qt.CursorShape.SizeHorCursor,
+    HoverType.RIGHT: Qt.CursorShape.SizeHorCursor,
+    HoverType.TOP_LEFT: Qt.CursorShape.SizeFDiagCursor,
+    HoverType.BOTTOM_RIGHT: Qt.CursorShape.SizeFDiagCursor,
+    HoverType.TOP_RIGHT: Qt.CursorShape.SizeBDiagCursor,
+    HoverType.BOTTOM_LEFT: Qt.CursorShape.SizeBDiagCursor
+}
+
+
+def get_cache_key(image_path: str) -> str:
+    """Build a pixmap cache key unique to the image path and contents."""
+    return f'{image_path}:{os.path.getmtime(image_path)}'
+
+
+class SaveTask(QRunnable):
+    """Serializes and writes annotations to disk off the GUI thread."""
+
+    def __init__(self,
+                 controller: 'AnnotationController',
+                 image_name: str,
+                 image_size: tuple[int, int],
+                 annotations: list[Annotation]
+                 ) -> None:
+        super().__init__()
+
+        self.controller = controller
+        self.image_name = image_name
+        self.image_size = image_size
+        self.annotations = annotations
+
+    def run(self) -> None:
+        self.controller.save_annotations(
+            self.image_name, self.image_size, self.annotations)
 
 
 class Canvas(QWidget):
@@ -55,13 +96,25 @@ class Canvas(QWidget):
         self.quick_create = False
         self.previous_label = None
 
-        self.unsaved_changes = False
+        self._unsaved_changes = False
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)  # Keep writes ordered
+
         self.auto_save_timer = QTimer()
+        self.auto_save_timer.setSingleShot(True)
         self.auto_save_timer.timeout.connect(self.save_progress)
-        self.auto_save_timer.start(3000)
+
+        self.hover_timer = QTimer()
+        self.hover_timer.setSingleShot(True)
+        self.hover_timer.setInterval(16)  # Coalesce hover work to ~60 Hz
+        self.hover_timer.timeout.connect(self._process_hover)
 
         self.image_name = None
         self.pixmap = QPixmap()
+        self._geometry_cache = None
+        self._scaled_pixmap = None
+
+        QPixmapCache.setCacheLimit(256 * 1024)  # Kilobytes
 
         self.keypoint_annotator = KeypointAnnotator(self)
         self.annotating_state = AnnotatingState.IDLE
@@ -84,17 +137,33 @@ class Canvas(QWidget):
         self.action_handler = ActionHandler(self, self.image_name)
         self.brightness_handler = BrightnessHandler(self)
         self.zoom_handler = ZoomHandler(self)
+        self.image_loader = ImageLoader(self)
+        self.hover_index = HoverIndex(self)
 
         self.pos_start_anno = None
         self.pos_start_kpt = None
 
-        for action in CanvasActions(self).actions.values():
-            self.addAction(action)
+        self.addActions(list(CanvasActions(self).actions.values()))
 
     @property
     def label_map(self) -> LabelMapController:
         return self.parent.label_map_controller
 
+    @property
+    def unsaved_changes(self) -> bool:
+        return self._unsaved_changes
+
+    @unsaved_changes.setter
+    def unsaved_changes(self, unsaved: bool) -> None:
+        # Only arm the auto-save timer when there is something to save
+        if unsaved and not self._unsaved_changes:
+            self.auto_save_timer.start(3000)
+
+        elif not unsaved:
+            self.auto_save_timer.stop()
+
+        self._unsaved_changes = unsaved
+
     @property
     def label_names(self) -> list[str]:
         return [label['name'] for label in self.label_map.labels]
@@ -121,26 +190,57 @@ class Canvas(QWidget):
 
     def reset(self) -> None:
         self.annotations = []
+        self.hover_index.invalidate()
         self.zoom_handler.reset()
         self.brightness_handler.reset()
+        self.invalidate_geometry()
 
     def load_image(self, image_path: str) -> None:
         self.set_annotating_state(AnnotatingState.IDLE)
         self.save_progress()
         self.reset()
 
-        image = QImageReader(image_path).read()
-        self.pixmap = QPixmap.fromImage(image)
-        self.brightness_handler.set_pixmap(self.pixmap)
-
         self.image_name = os.path.basename(image_path)
         self.action_handler.image_name = self.image_name
 
+        pixmap = QPixmapCache.find(get_cache_key(image_path))
+
+        if pixmap is None:
+            # Show a blank canvas until the decode thread delivers
+            self.pixmap = QPixmap()
+            self.invalidate_geometry()
+
+            self.image_loader.load(image_path)
+            self.update()
+            return
+
+        self.set_pixmap(pixmap)
+
+    def prefetch_image(self, image_path: str) -> None:
+        """Decode an image in the background to speed up navigation."""
+        if QPixmapCache.find(get_cache_key(image_path)) is None:
+            self.image_loader.load(image_path)
+
+    def on_image_loaded(self, image_path: str, image: QImage) -> None:
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(get_cache_key(image_path), pixmap)
+
+        if os.path.basename(image_path) != self.image_name:
+            return  # A stale decode, the user has already moved on
+
+        self.set_pixmap(pixmap)
+
+    def set_pixmap(self, pixmap: QPixmap) -> None:
+        self.pixmap = pixmap
+        self.brightness_handler.set_pixmap(pixmap)
+        self.invalidate_geometry()
+
         self.unsaved_changes = True
         self.update()
 
     def load_annotations(self, annotations: list[Annotation]) -> None:
         self.annotations = annotations
+        self.hover_index.invalidate()
         self.set_hovered_object()
 
         self.unselect_all()
@@ -153,38 +253,82 @@ class Canvas(QWidget):
         self.unsaved_changes = False
         image_size = self.pixmap.width(), self.pixmap.height()
 
-        self.parent.annotation_controller.save_annotations(
-            self.image_name, image_size, self.annotations)
+        # Snapshot the annotations so the worker never sees live edits
+        annotations = [anno.copy() for anno in self.annotations]
+
+        self.save_pool.start(SaveTask(self.parent.annotation_controller,
+                                      self.image_name,
+                                      image_size,
+                                      annotations))
+
+    def wait_for_save(self) -> None:
+        """Block until any in-flight save has been written to disk."""
+        self.save_pool.waitForDone()
+
+    def invalidate_geometry(self) -> None:
+        """Drop the cached scale/offset values after a geometry change."""
+        self._geometry_cache = None
+        self._scaled_pixmap = None
+
+    def get_scaled_pixmap(self) -> QPixmap | None:
+        """Get the pixmap pre-scaled to the current fit-to-window size.
+
+        Only maintained at 1x zoom, where the scaled size matches the
+        widget: zoomed-in sizes would be too large to keep around, so
+        the painter falls back to a transform draw instead.
+        """
+        if self.zoom_handler.zoom_level != 1 or self.pixmap.isNull():
+            return None
+
+        if self._scaled_pixmap is None:
+            size = self.pixmap.size() * self.get_scale()
+            self._scaled_pixmap = self.pixmap.scaled(
+                size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation)
+
+        return self._scaled_pixmap
+
+    def _get_geometry(self) -> tuple[float, float, float]:
+        """Get the scale and center offsets, excluding panning.
+
+        These only depend on the widget size, the pixmap size and the
+        zoom level, so they are cached between geometry changes.
+        """
+        if self._geometry_cache is not None:
+            return self._geometry_cache
 
-    def get_center_offset(self) -> tuple[int, int]:
         canvas = self.size()
         image = self.pixmap
 
-        scale = self.get_scale()
+        scale = 1.0
+        if not image.isNull():
+            canvas_aspect = canvas.width() / canvas.height()
+            image_aspect = image.width() / image.height()
+
+            scale = canvas.height() / image.height()
+
+            if canvas_aspect < image_aspect:
+                scale = canvas.width() / image.width()
+
+            scale *= self.zoom_handler.zoom_level
+
         offset_x = (canvas.width() - image.width() * scale) / 2
         offset_y = (canvas.height() - image.height() * scale) / 2
 
+        self._geometry_cache = scale, offset_x, offset_y
+        return self._geometry_cache
+
+    def get_center_offset(self) -> tuple[int, int]:
+        _, offset_x, offset_y = self._get_geometry()
+
         offset_x += self.zoom_handler.pan_x
         offset_y += self.zoom_handler.pan_y
 
         return int(offset_x), int(offset_y)
 
     def get_scale(self) -> float:
-        if self.pixmap.isNull():
-            return 1.0
-
-        canvas = super().size()
-        image = self.pixmap
-
-        canvas_aspect = canvas.width() / canvas.height()
-        image_aspect = image.width() / image.height()
-
-        scale = canvas.height() / image.height()
-
-        if canvas_aspect < image_aspect:
-            scale = canvas.width() / image.width()
-
-        return scale * self.zoom_handler.zoom_level
+        return self._get_geometry()[0]
 
     def is_cursor_in_bounds(self) -> bool:
         x_pos, y_pos = self.mouse_handler.cursor_position
@@ -209,25 +353,17 @@ class Canvas(QWidget):
             cursor = Qt.CursorShape.PointingHandCursor
 
         else:
-            left_clicked = self.mouse_handler.left_clicked
             hover_type = self.hovered_anno.hovered \
                 if self.hovered_anno else HoverType.NONE
 
-            cursor = Qt.CursorShape.ArrowCursor
+            if hover_type == HoverType.FULL:
+                cursor = Qt.CursorShape.ClosedHandCursor \
+                    if self.mouse_handler.left_clicked \
+                    else Qt.CursorShape.OpenHandCursor
 
-            match left_clicked, hover_type:
-                case True, HoverType.FULL:
-                    cursor = Qt.CursorShape.ClosedHandCursor
-                case False, HoverType.FULL:
-                    cursor = Qt.CursorShape.OpenHandCursor
-                case _, HoverType.TOP | HoverType.BOTTOM:
-                    cursor = Qt.CursorShape.SizeVerCursor
-                case _, HoverType.LEFT | HoverType.RIGHT:
-                    cursor = Qt.CursorShape.SizeHorCursor
-                case _, HoverType.TOP_LEFT | HoverType.BOTTOM_RIGHT:
-                    cursor = Qt.CursorShape.SizeFDiagCursor
-                case _, HoverType.TOP_RIGHT | HoverType.BOTTOM_LEFT:
-                    cursor = Qt.CursorShape.SizeBDiagCursor
+            else:
+                cursor = __hover_cursors__.get(
+                    hover_type, Qt.CursorShape.ArrowCursor)
 
         if cursor != QApplication.overrideCursor().shape():
             QApplication.restoreOverrideCursor()
@@ -288,28 +424,30 @@ class Canvas(QWidget):
         self.update()
 
     def set_hovered_object(self) -> None:
+        # Only the tracked objects can carry a stale hover flag, so
+        # clear those two instead of sweeping every annotation
+        if self.hovered_anno:
+            self.hovered_anno.hovered = HoverType.NONE
+
+        if self.hovered_keypoint:
+            self.hovered_keypoint.hovered = False
+
         self.hovered_keypoint = None
         self.hovered_anno = None
 
         mouse_pos = self.mouse_handler.cursor_position
         annotator = self.keypoint_annotator
 
-        annotations = [annotator.annotation] if annotator.active \
-            else self.annotations
-
-        for anno in annotations:
-            anno.hovered = HoverType.NONE
-
-            for keypoint in anno.keypoints:
-                keypoint.hovered = False
-
         if self.annotating_state not in \
                 (AnnotatingState.IDLE, AnnotatingState.DRAWING_KEYPOINTS):
             return
 
         margin = -0.57 * self.get_scale() + 5.3  # Consts chosen empirically
 
-        for anno in annotations[::-1]:
+        candidates = [annotator.annotation] if annotator.active \
+            else self.hover_index.query(mouse_pos, margin)
+
+        for anno in candidates:
             hovered_keypoint = anno.get_hovered_keypoint(margin, mouse_pos)
             hovered_type = anno.get_hovered_type(margin, mouse_pos)
 
@@ -349,6 +487,7 @@ class Canvas(QWidget):
         if annotation in self.annotations:
             self.annotations.remove(annotation)
             self.annotations.append(annotation)
+            self.hover_index.invalidate()
 
     def unselect_annotation(self, annotation: Annotation) -> None:
         annotation.selected = SelectionType.UNSELECTED
@@ -652,6 +791,8 @@ class Canvas(QWidget):
         else:
             anno.fit_bbox_to_keypoints()
 
+        self.hover_index.invalidate()
+
     def move_keypoint(self,
                       keypoint: Keypoint,
                       delta: tuple[int, int]
@@ -663,6 +804,7 @@ class Canvas(QWidget):
         pos_y = clip_value(pos_y + delta_y, 0, self.pixmap.height())
 
         keypoint.position = [pos_x, pos_y]
+        self.hover_index.invalidate()
 
     def move_annotation_arrow(self, delta: tuple[int, int]) -> None:
         selected_anno = self.selected_annos[-1]
@@ -888,12 +1030,16 @@ class Canvas(QWidget):
         if self.annotating_state in (AnnotatingState.MOVING_ANNO,
                                      AnnotatingState.MOVING_KEYPOINT):
             self.set_annotating_state(AnnotatingState.IDLE)
+            self.update()
 
-        else:
-            self.set_hovered_object()
+        elif not self.hover_timer.isActive():
+            self.hover_timer.start()
 
-            if self.annotating_state == AnnotatingState.DRAWING_KEYPOINTS:
-                self.keypoint_annotator.update()
+    def _process_hover(self) -> None:
+        self.set_hovered_object()
+
+        if self.annotating_state == AnnotatingState.DRAWING_KEYPOINTS:
+            self.keypoint_annotator.update()
 
         self.update()
 
@@ -983,10 +1129,11 @@ class Canvas(QWidget):
         self.keyboard_handler.keyReleaseEvent(event)
 
     def resizeEvent(self, event: QResizeEvent) -> None:
+        self.invalidate_geometry()
         self.zoom_handler.clip_pan_values()
         super().resizeEvent(event)
 
-    def paintEvent(self, _: QPaintEvent) -> None:
+    def paintEvent(self, event: QPaintEvent) -> None:
         painter = CanvasPainter(self)
-        painter.paint_scene()
+        painter.paint_scene(event.rect())
         painter.end()
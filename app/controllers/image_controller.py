@@ -34,6 +34,12 @@ class ImageController:
     def get_image_name(self) -> str:
         return os.path.basename(self.get_image_path())
 
+    def get_neighbor_paths(self) -> list[str]:
+        neighbors = self.index - 1, self.index + 1
+
+        return [self.image_paths[index] for index in neighbors
+                if 0 <= index < self.num_images]
+
     def get_image_status(self) -> str:
         return f'{self.get_image_name()} [{self.index + 1}/{self.num_images}]'
 
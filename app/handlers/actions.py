@@ -329,6 +329,8 @@ class ActionHandler:
         stack_to.append(action)
 
         action.undo() if undo else action.do()
+        self.parent.hover_index.invalidate()
+
         if isinstance(action, (ActionCreate, ActionDelete)):
             self.parent.parent.annotation_list.redraw_widgets()
 
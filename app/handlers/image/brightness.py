@@ -51,6 +51,7 @@ class BrightnessHandler:
         array[..., :3] = lookup_table[array[..., :3]]
 
         self.parent.pixmap = self._array_to_pixmap(array)
+        self.parent.invalidate_geometry()
         self.set_indicator()
 
     def increase_brightness(self) -> None:
@@ -0,0 +1,50 @@
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+if TYPE_CHECKING:
+    from app.canvas import Canvas
+
+
+class ImageLoader(QObject):
+    """Decodes image files on worker threads to keep the GUI responsive."""
+
+    image_loaded = pyqtSignal(str, QImage)
+
+    def __init__(self, parent: 'Canvas') -> None:
+        super().__init__(parent)
+        self.parent = parent
+
+        self.thread_pool = QThreadPool(self)
+        self.image_loaded.connect(self._on_image_loaded)
+
+        self._pending = set()
+
+    def load(self, image_path: str) -> None:
+        if image_path in self._pending:
+            return
+
+        self._pending.add(image_path)
+        self.thread_pool.start(DecodeTask(image_path, self.image_loaded))
+
+    def _on_image_loaded(self, image_path: str, image: QImage) -> None:
+        self._pending.discard(image_path)
+        self.parent.on_image_loaded(image_path, image)
+
+
+class DecodeTask(QRunnable):
+    def __init__(self, image_path: str, signal: pyqtSignal) -> None:
+        super().__init__()
+
+        self.image_path = image_path
+        self.signal = signal
+
+    def run(self) -> None:
+        image = QImageReader(self.image_path).read()
+
+        # Match the backing-store format so QPixmap.fromImage on the
+        # GUI thread skips a per-pixel conversion pass
+        image.convertTo(QImage.Format.Format_ARGB32_Premultiplied)
+
+        self.signal.emit(self.image_path, image)
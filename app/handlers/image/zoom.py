@@ -35,6 +35,7 @@ class ZoomHandler:
         self.zoom_level = clip_value(zoom_level,
                                      self._min_zoom,
                                      self._max_zoom)
+        self.parent.invalidate_geometry()
 
         scale_after = self.parent.get_scale()
         offset_x_after, offset_y_after = self.parent.get_center_offset()
@@ -74,6 +75,7 @@ class ZoomHandler:
 
     def reset(self) -> None:
         self.zoom_level = self._min_zoom
+        self.parent.invalidate_geometry()
         self.unset_indicator()
 
         self.pan_x = 0
@@ -5,9 +5,9 @@ from app.controllers.label_map_controller import LabelMapController
 from app.enums.annotation import HoverType, SelectionType
 from app.enums.canvas import AnnotatingState
 from app.objects import Annotation
-from app.utils import text_to_color, clip_value
+from app.utils import clip_value
 
-from PyQt6.QtCore import Qt, QPoint, QPointF, QRectF
+from PyQt6.QtCore import Qt, QPoint, QPointF, QRect, QRectF
 from PyQt6.QtGui import (
     QPen,
     QBrush,
@@ -80,11 +80,40 @@ class CanvasPainter(QPainter):
 
         return left, top, right, bot
 
-    def draw_pixmap(self, pixmap: QPixmap) -> None:
+    def intersects_region(self, anno: Annotation, region: QRect) -> bool:
+        """Check if an annotation overlaps the exposed widget region."""
+        bounds = anno.position or anno.implicit_bbox
+        if not bounds:
+            return True
+
+        left, top, right, bot = bounds
+
+        if anno.has_keypoints:
+            kpts_x, kpts_y = zip(*(kpt.position for kpt in anno.keypoints
+                                   if kpt.visible))
+
+            left, top = min(left, *kpts_x), min(top, *kpts_y)
+            right, bot = max(right, *kpts_x), max(bot, *kpts_y)
+
+        left, top, right, bot = self.scale_box((left, top, right, bot))
+
+        margin = 8  # Account for the pen width and keypoint radius
+        return region.intersects(QRect(left - margin,
+                                       top - margin,
+                                       right - left + 2 * margin,
+                                       bot - top + 2 * margin))
+
+    def draw_pixmap(self) -> None:
         self.translate(QPoint(*self._offsets))
-        self.scale(*[self._scale] * 2)
+        scaled_pixmap = self.canvas.get_scaled_pixmap()
+
+        if scaled_pixmap is not None:
+            self.drawPixmap(0, 0, scaled_pixmap)
+
+        else:
+            self.scale(*[self._scale] * 2)
+            self.drawPixmap(0, 0, self.canvas.pixmap)
 
-        self.drawPixmap(0, 0, pixmap)
         self.resetTransform()
 
     def draw_crosshair(self, cursor_position: tuple[int, int]) -> None:
@@ -120,8 +149,7 @@ class CanvasPainter(QPainter):
         pos_x = clip_value(pos_x, offset_x, width - offset_x)
         pos_y = clip_value(pos_y, offset_y, height - offset_y)
 
-        label_schema = self.canvas.keypoint_annotator.annotation.label_schema
-        anno_color = text_to_color(label_schema.label_name)
+        anno_color = self.canvas.keypoint_annotator.annotation.color
 
         self.set_fill_color(anno_color)
         self.set_outline_color((*anno_color, 155))
@@ -191,19 +219,20 @@ class CanvasPainter(QPainter):
         text_y = pos_y + font_metrics.ascent() + 8
         self.drawText(QPointF(text_x, text_y), text)
 
-    def paint_scene(self) -> None:
-        self.draw_pixmap(self.canvas.pixmap)
+    def paint_scene(self, region: QRect) -> None:
+        self.draw_pixmap()
 
-        annos_to_draw = self.canvas.annotations.copy()
+        annos_to_draw = self.canvas.annotations
 
         if self.canvas.keypoint_annotator.active:
             current_anno = self.canvas.keypoint_annotator.annotation
 
             if current_anno not in annos_to_draw:
-                annos_to_draw.append(current_anno)
+                annos_to_draw = annos_to_draw + [current_anno]
 
         for annotation in annos_to_draw:
-            if not annotation.hidden or annotation.highlighted:
+            if (not annotation.hidden or annotation.highlighted) \
+                    and self.intersects_region(annotation, region):
                 self.anno_painter.draw_annotation(annotation)
 
         state = self.canvas.annotating_state
@@ -258,7 +287,7 @@ class AnnotationPainter:
         self.parent.set_outline_color(
             (205, 205, 205, 255)
             if highlighted and not drawing_keypoints
-            else (*text_to_color(anno.label_name), 155))
+            else (*anno.color, 155))
 
         if anno.hidden:
             return
@@ -309,7 +338,7 @@ class AnnotationPainter:
         if 'full' in fill_areas and any(kpt.selected for kpt in anno.keypoints):
             return
 
-        anno_color = *text_to_color(anno.label_name), 100
+        anno_color = *anno.color, 100
         self.parent.fillPath(fill_path, QColor(*anno_color))
 
     def draw_keypoints(self, anno: Annotation) -> None:
@@ -317,7 +346,7 @@ class AnnotationPainter:
         annotating = keypoint_annotator.active and \
             keypoint_annotator.annotation == anno
 
-        anno_color = text_to_color(anno.label_name)
+        anno_color = anno.color
         anno_selected = anno.selected in (SelectionType.SELECTED,
                                           SelectionType.NEWLY_SELECTED)
 
@@ -350,7 +379,7 @@ class AnnotationPainter:
         self.parent.set_fill_color(None)
 
     def draw_keypoint_edges(self, anno: Annotation) -> None:
-        anno_color = text_to_color(anno.label_name)
+        anno_color = anno.color
         anno_selected = anno.selected in (SelectionType.SELECTED,
                                           SelectionType.NEWLY_SELECTED)
 
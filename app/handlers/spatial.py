@@ -0,0 +1,79 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from app.objects import Annotation
+
+if TYPE_CHECKING:
+    from app.canvas import Canvas
+
+
+class HoverIndex:
+    """Vectorized index over annotation bounds for hover hit-testing.
+
+    Keeps the bounds of all annotations (bbox plus visible keypoints)
+    in a packed structure-of-arrays NumPy array, so finding candidates
+    for a mouse position is a single vectorized comparison instead of
+    per-annotation Python calls on every mouse move. The index is
+    rebuilt lazily after an invalidation.
+    """
+
+    def __init__(self, parent: 'Canvas') -> None:
+        self.parent = parent
+
+        self._annos = None
+        self._bounds = None
+
+    def invalidate(self) -> None:
+        self._annos = None
+
+    def _get_bounds(self, anno: Annotation) -> tuple[int, ...] | None:
+        bounds = anno.position or anno.implicit_bbox
+        if not bounds:
+            return None
+
+        left, top, right, bot = bounds
+
+        if anno.has_keypoints:
+            kpts_x, kpts_y = zip(*(kpt.position for kpt in anno.keypoints
+                                   if kpt.visible))
+
+            left, top = min(left, *kpts_x), min(top, *kpts_y)
+            right, bot = max(right, *kpts_x), max(bot, *kpts_y)
+
+        return left, top, right, bot
+
+    def _rebuild(self) -> None:
+        annos, bounds = [], []
+
+        # Front-to-back, matching the canvas' hover priority
+        for anno in reversed(self.parent.annotations):
+            anno_bounds = self._get_bounds(anno)
+
+            if anno_bounds is not None:
+                annos.append(anno)
+                bounds.append(anno_bounds)
+
+        self._annos = annos
+        self._bounds = np.array(bounds, dtype=np.float64).reshape(-1, 4)
+
+    def query(self,
+              mouse_pos: tuple[float, float],
+              margin: float
+              ) -> list[Annotation]:
+        """Get the annotations near the cursor, front-to-back."""
+        if self._annos is None:
+            self._rebuild()
+
+        if not self._annos:
+            return []
+
+        x_pos, y_pos = mouse_pos
+        bounds = self._bounds
+
+        mask = ((bounds[:, 0] - margin <= x_pos)
+                & (x_pos <= bounds[:, 2] + margin)
+                & (bounds[:, 1] - margin <= y_pos)
+                & (y_pos <= bounds[:, 3] + margin))
+
+        return [self._annos[index] for index in np.flatnonzero(mask)]
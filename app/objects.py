@@ -3,47 +3,46 @@ from uuid import uuid4
 
 from app.enums.annotation import HoverType, SelectionType
 from app.controllers.label_map_controller import LabelSchema
+from app.utils import pretty_text, text_to_color
+
+__hover_types__ = frozenset(HoverType)
 
 
 class Bbox:
+    __slots__ = ('has_bbox', '_position', 'left', 'top', 'right', 'bottom',
+                 'width', 'height', 'area', 'xywh')
+
     def __init__(self, position: list[int, ...] = None) -> None:
-        self.position = position or []
         self.has_bbox = bool(position)
+        self.position = position or []
 
     @property
-    def xywh(self) -> tuple[int, ...]:
-        return self.left, self.top, self.width, self.height
-
-    @property
-    def left(self) -> int:
-        return self.position[0]
-
-    @property
-    def top(self) -> int:
-        return self.position[1]
-
-    @property
-    def right(self) -> int:
-        return self.position[2]
+    def position(self) -> list[int, ...]:
+        return self._position
 
-    @property
-    def bottom(self) -> int:
-        return self.position[3]
+    @position.setter
+    def position(self, position: list[int, ...]) -> None:
+        """Store the position and precompute the derived geometry.
 
-    @property
-    def width(self) -> int:
-        return self.right - self.left
+        Positions are only ever replaced wholesale, so the setter is
+        the single place where the derived attributes can change. The
+        hover and paint paths then read plain attributes with no
+        descriptor dispatch.
+        """
+        self._position = position
 
-    @property
-    def height(self) -> int:
-        return self.bottom - self.top
+        if position:
+            self.left, self.top, self.right, self.bottom = position
 
-    @property
-    def area(self) -> int:
-        return self.width * self.height
+            self.width = self.right - self.left
+            self.height = self.bottom - self.top
+            self.area = self.width * self.height
+            self.xywh = (self.left, self.top, self.width, self.height)
 
 
 class Keypoint:
+    __slots__ = ('parent', 'position', 'visible', 'hovered', 'selected')
+
     def __init__(self,
                  parent: 'Annotation',
                  position: list[int],
@@ -70,6 +69,10 @@ class Keypoint:
 
 
 class Annotation(Bbox):
+    __slots__ = ('label_schema', 'ref_id', 'keypoints', 'selected',
+                 'hovered', 'highlighted', 'hidden', 'implicit_bbox',
+                 '_label_style')
+
     def __init__(self,
                  label_schema: LabelSchema,
                  position: list[int] = None,
@@ -91,6 +94,7 @@ class Annotation(Bbox):
         self.hidden = False
 
         self.implicit_bbox = []
+        self._label_style = None
 
     def __eq__(self, other: 'Annotation') -> bool:
         if isinstance(other, Annotation):
@@ -98,25 +102,44 @@ class Annotation(Bbox):
 
         return False
 
-    def __copy__(self) -> 'Annotation':
-        box_only = self.selected == SelectionType.BOX_ONLY
-        keypoints = None if box_only else self.keypoints
+    def __hash__(self) -> int:
+        return hash(self.ref_id)
 
+    def __copy__(self) -> 'Annotation':
         copied_anno = Annotation(copy.copy(self.label_schema),
-                                 copy.copy(self.position),
-                                 copy.deepcopy(keypoints))
+                                 copy.copy(self.position))
 
-        copied_anno.implicit_bbox = self.implicit_bbox.copy()
-
-        for keypoint in copied_anno.keypoints:
-            keypoint.parent = copied_anno
+        if self.selected != SelectionType.BOX_ONLY:
+            copied_anno.keypoints = [
+                Keypoint(copied_anno, keypoint.position.copy(),
+                         keypoint.visible)
+                for keypoint in self.keypoints]
 
+        copied_anno.implicit_bbox = self.implicit_bbox.copy()
         return copied_anno
 
     @property
     def label_name(self) -> str:
         return self.label_schema.label_name
 
+    @property
+    def color(self) -> tuple[int, int, int]:
+        return self._get_label_style()[0]
+
+    @property
+    def pretty_name(self) -> str:
+        return self._get_label_style()[1]
+
+    def _get_label_style(self) -> tuple[tuple[int, int, int], str]:
+        """Get the display color and name, recomputed only on rename."""
+        if self._label_style is None \
+                or self._label_style[0] != self.label_name:
+            self._label_style = (self.label_name,
+                                 text_to_color(self.label_name),
+                                 pretty_text(self.label_name))
+
+        return self._label_style[1:]
+
     @property
     def kpt_names(self) -> list[str]:
         return self.label_schema.kpt_names
@@ -149,25 +172,25 @@ class Annotation(Bbox):
 
             return HoverType.NONE
 
-        if not (self.left - margin <= pos_x <= self.right + margin and
-                self.top - margin <= pos_y <= self.bottom + margin):
-            return HoverType.NONE
+        delta_left = pos_x - self.left
+        delta_right = self.right - pos_x
+        delta_top = pos_y - self.top
+        delta_bot = self.bottom - pos_y
 
-        top = abs(pos_y - self.top) <= margin
-        left = abs(pos_x - self.left) <= margin
-        right = abs(pos_x - self.right) <= margin
-        bottom = abs(pos_y - self.bottom) <= margin
+        if min(delta_left, delta_right, delta_top, delta_bot) < -margin:
+            return HoverType.NONE
 
-        hover_type = HoverType.NONE
-        hover_type |= top and HoverType.TOP
-        hover_type |= left and HoverType.LEFT
-        hover_type |= right and HoverType.RIGHT
-        hover_type |= bottom and HoverType.BOTTOM
+        # The rejection above bounds every delta from below, so a
+        # one-sided comparison per edge is enough
+        hover_type = (HoverType.TOP * (delta_top <= margin)
+                      | HoverType.LEFT * (delta_left <= margin)
+                      | HoverType.RIGHT * (delta_right <= margin)
+                      | HoverType.BOTTOM * (delta_bot <= margin))
 
-        if not (hover_type and hover_type in set(HoverType)):
+        if not (hover_type and hover_type in __hover_types__):
             return HoverType.FULL
 
-        return hover_type
+        return HoverType(hover_type)
 
     def get_hovered_keypoint(self,
                              margin: float,
@@ -178,16 +201,21 @@ class Annotation(Bbox):
         min_distance = 2 * margin
         closest_keypoint = None
 
-        for keypoint in self.keypoints[::-1]:
+        for keypoint in reversed(self.keypoints):
+            if not keypoint.visible:
+                continue
+
             distance_x = abs(keypoint.pos_x - pos_x)
-            distance_y = abs(keypoint.pos_y - pos_y)
 
-            if distance_x <= margin and distance_y <= margin:
-                distance = distance_x + distance_y
+            if distance_x > margin:
+                continue
+
+            distance_y = abs(keypoint.pos_y - pos_y)
+            distance = distance_x + distance_y
 
-                if distance < min_distance and keypoint.visible:
-                    closest_keypoint = keypoint
-                    min_distance = distance
+            if distance_y <= margin and distance < min_distance:
+                closest_keypoint = keypoint
+                min_distance = distance
 
         return closest_keypoint
 
@@ -205,9 +233,8 @@ class Annotation(Bbox):
         copied.implicit_bbox = self.implicit_bbox.copy()
         copied.ref_id = self.ref_id
         copied.selected = self.selected
-        copied.keypoints = copy.deepcopy(self.keypoints)
-
-        for kpt in copied.keypoints:
-            kpt.parent = copied
+        copied.keypoints = [Keypoint(copied, keypoint.position.copy(),
+                                     keypoint.visible)
+                            for keypoint in self.keypoints]
 
         return copied
@@ -1,4 +1,5 @@
 import hashlib
+from functools import lru_cache
 
 import enchant
 
@@ -9,6 +10,7 @@ def clip_value(value: float, mininum: float, maximum: float) -> int | float:
     return min(max(value, mininum), maximum)
 
 
+@lru_cache(maxsize=1024)
 def text_to_color(text: str) -> tuple[int, int, int]:
     hash_code = int(hashlib.sha256(text.encode('utf-8')).hexdigest(), 16)
 
@@ -19,6 +21,7 @@ def text_to_color(text: str) -> tuple[int, int, int]:
     return red, green, blue
 
 
+@lru_cache(maxsize=1024)
 def pretty_text(text: str) -> str:
     words = text.replace('_', ' ').replace('-', ' ').split(' ')
     words = [word.capitalize() if us_dict.check(word) else word.upper()
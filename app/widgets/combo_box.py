@@ -1,8 +1,8 @@
 from typing import TYPE_CHECKING, Callable
 
 import rapidfuzz
-from rapidfuzz.fuzz import partial_ratio
-from PyQt6.QtCore import Qt, QObject, QEvent
+from rapidfuzz.fuzz import WRatio
+from PyQt6.QtCore import Qt, QObject, QEvent, QTimer
 from PyQt6.QtGui import QKeyEvent
 from PyQt6.QtWidgets import (
     QWidget,
@@ -21,6 +21,12 @@ if TYPE_CHECKING:
 __windowtype__ = Qt.WindowType.FramelessWindowHint
 __background__ = Qt.WidgetAttribute.WA_TranslucentBackground
 
+__handled_events__ = frozenset({
+    QEvent.Type.KeyPress,
+    QEvent.Type.HoverMove,
+    QEvent.Type.MouseButtonPress
+})
+
 
 class ComboBox(QMenu, QWidget):
     def __init__(self,
@@ -46,12 +52,20 @@ class ComboBox(QMenu, QWidget):
 
         self.labels_filtered = options[:self.num_results]
         self.label_widgets = [QLabel() for _ in range(self.num_results)]
+        self.widget_indices = {widget: index for index, widget
+                               in enumerate(self.label_widgets)}
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(40)  # Coalesce bursts of keystrokes
+        self.search_timer.timeout.connect(self._on_text_changed)
 
         self.text_widget = QLineEdit()
         self.text_widget.setAttribute(__background__)
         self.text_widget.setPlaceholderText(placeholder_text)
-        self.text_widget.returnPressed.connect(self._select)
-        self.text_widget.textChanged.connect(self._on_text_changed)
+        self.text_widget.returnPressed.connect(self._on_return_pressed)
+        self.text_widget.textChanged.connect(
+            lambda: self.search_timer.start())
 
         self._add_item(self.text_widget)
         self.addSeparator()
@@ -79,7 +93,14 @@ class ComboBox(QMenu, QWidget):
         self.addAction(widget_action)
 
     def eventFilter(self, source: QObject, event: QEvent) -> bool:
-        if event.type() == QEvent.Type.KeyPress:
+        event_type = event.type()
+
+        # Qt routes every event type through here; bail early on the
+        # ones we never act on
+        if event_type not in __handled_events__:
+            return True
+
+        if event_type == QEvent.Type.KeyPress:
             self._on_key_press(event)
 
         if not source.layout():
@@ -87,10 +108,10 @@ class ComboBox(QMenu, QWidget):
 
         source_widget = source.layout().itemAt(0).widget()
 
-        if event.type() == event.Type.HoverMove:
+        if event_type == QEvent.Type.HoverMove:
             self._on_mouse_hover(source_widget)
 
-        elif event.type() == event.Type.MouseButtonPress:
+        elif event_type == QEvent.Type.MouseButtonPress:
             self._select()
 
         return True
@@ -101,6 +122,14 @@ class ComboBox(QMenu, QWidget):
         self.text_widget.setFocus()
         self.parent.update_cursor_icon(Qt.CursorShape.ArrowCursor)
 
+    def _on_return_pressed(self) -> None:
+        # Apply a still-pending search so Enter acts on the typed text
+        if self.search_timer.isActive():
+            self.search_timer.stop()
+            self._on_text_changed()
+
+        self._select()
+
     def _on_text_changed(self) -> None:
         pass
 
@@ -115,25 +144,64 @@ class ComboBox(QMenu, QWidget):
 
 
 class AnnotationComboBox(ComboBox):
+    # Class-level default: the base __init__ calls update() before the
+    # subclass __init__ body runs
+    _styled_widget = None
+    _style_normal = 'border: none; border-bottom: none;'
+
     def __init__(self, parent: 'Canvas', labels: list[str]) -> None:
         def get_num_labels() -> int:
             return clip_value(len(labels), 1, 5)
 
         super().__init__(parent, labels, 'Category', get_num_labels)
 
+        self._options_normalized = [option.lower().replace(' ', '_')
+                                    for option in self.options]
+        self._sort_cache = {}
+
     def _sort_labels(self, target: str) -> list[str]:
         target = target.lower().replace(' ', '_')
 
+        # Backspacing and retyping repeat queries, so cache per target
+        if (sorted_labels := self._sort_cache.get(target)) is not None:
+            return sorted_labels
+
+        sorted_labels = self._compute_sorted_labels(target)
+
+        if len(self._sort_cache) > 256:
+            self._sort_cache.clear()
+
+        self._sort_cache[target] = sorted_labels
+        return sorted_labels
+
+    def _compute_sorted_labels(self, target: str) -> list[str]:
+        if not target:
+            return self.options[:self.num_results]
+
+        # Exact-prefix typing is the common case and needs no fuzzing
+        prefix_hits = [option for option, normalized
+                       in zip(self.options, self._options_normalized)
+                       if normalized.startswith(target)]
+
+        if len(prefix_hits) >= self.num_results:
+            return prefix_hits[:self.num_results]
+
         matches = rapidfuzz.process.extract(target,
-                                            self.options,
-                                            scorer=partial_ratio,
-                                            limit=self.num_results)
+                                            self._options_normalized,
+                                            scorer=WRatio,
+                                            score_cutoff=40,
+                                            limit=self.num_results,
+                                            processor=None)
 
-        return [match[0] for match in matches]
+        return [self.options[match[2]] for match in matches]
 
     def _on_text_changed(self) -> None:
         target = self.text_widget.text()
-        self.labels_filtered = self._sort_labels(target)
+
+        # Overwrite in place so cached result lists are never aliased
+        self.labels_filtered[:] = self._sort_labels(target)
+        self.selected_index = clip_value(
+            self.selected_index, 0, max(len(self.labels_filtered) - 1, 0))
 
         self.update()
 
@@ -147,15 +215,22 @@ class AnnotationComboBox(ComboBox):
         elif event.key() == Qt.Key.Key_Escape:
             self.close()
 
-        self.selected_index = clip_value(index, 0, self.num_results - 1)
+        self.selected_index = clip_value(
+            index, 0, max(len(self.labels_filtered) - 1, 0))
         self.update()
 
     def _on_mouse_hover(self, widget: QWidget) -> None:
         if not isinstance(widget, QLabel):
             return
 
-        self.selected_index = self.label_widgets.index(widget)
-        self.update()
+        index = self.widget_indices[widget]
+
+        if index >= len(self.labels_filtered):
+            return  # Cleared row below the last result
+
+        if self.selected_index != index:
+            self.selected_index = index
+            self.update()
 
     def _select(self) -> None:
         if not self.labels_filtered:
@@ -165,19 +240,40 @@ class AnnotationComboBox(ComboBox):
         self.close()
 
     def update(self) -> None:
-        if not self.labels_filtered:
-            self.label_widgets[0].setText('<i>No labels available</i>')
+        labels_filtered = self.labels_filtered
+        label_widgets = self.label_widgets
+
+        # The score cutoff can return fewer results than there are
+        # rows; clear the stale text left in the trailing ones
+        for widget in label_widgets[len(labels_filtered):]:
+            if widget.text():
+                widget.setText('')
+
+        if not labels_filtered:
+            label_widgets[0].setText('<i>No labels available</i>')
             return
 
-        selected_text = self.labels_filtered[self.selected_index]
-        underline_color = text_to_color(selected_text)
+        selected_index = self.selected_index
+        underline_color = text_to_color(labels_filtered[selected_index])
+
+        # Arrow-key and hover updates leave the texts untouched, and an
+        # unchanged setText still invalidates the row's layout
+        for widget, label in zip(label_widgets, labels_filtered):
+            text = pretty_text(label)
 
-        for widget, label in zip(self.label_widgets, self.labels_filtered):
-            widget.setStyleSheet('border: none; border-bottom: none;')
-            widget.setText(pretty_text(label))
+            if widget.text() != text:
+                widget.setText(text)
 
-        self.label_widgets[self.selected_index].setStyleSheet(
+        # Only the previously and newly selected rows change styling,
+        # so skip the stylesheet reparse on the rows in between
+        selected_widget = label_widgets[selected_index]
+
+        if self._styled_widget not in (None, selected_widget):
+            self._styled_widget.setStyleSheet(self._style_normal)
+
+        selected_widget.setStyleSheet(
             f'border: none; border-bottom: 2px solid rgb{underline_color};')
+        self._styled_widget = selected_widget
 
 
 class ImageComboBox(ComboBox):
@@ -228,8 +324,9 @@ class ImageComboBox(ComboBox):
         if not (isinstance(widget, QLabel) and widget.text()):
             return
 
-        self.selected_index = self.widgets.index(widget)
-        self.update()
+        if self.selected_index != (index := self.widget_indices[widget]):
+            self.selected_index = index
+            self.update()
 
     def _select(self) -> None:
         self.selected_value = self.widgets[self.selected_index].text()
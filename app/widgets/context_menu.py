@@ -29,6 +29,8 @@ __background__ = Qt.WidgetAttribute.WA_TranslucentBackground
 class ContextMenu(QMenu, QWidget):
     background_color = 'rgba(33, 33, 33, 0.75)'
     hover_color = 'rgba(53, 53, 53, 0.75)'
+    widget_style_sheet = str(WidgetStyleSheet(background_color))
+
     button_margins = 10, 6, 0, 6
     checkbox_margins = 10, 11, 0, 8
 
@@ -53,7 +55,7 @@ class ContextMenu(QMenu, QWidget):
         widget = QWidget()
         widget.installEventFilter(self)
         widget.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
-        widget.setStyleSheet(str(WidgetStyleSheet(self.background_color)))
+        widget.setStyleSheet(self.widget_style_sheet)
 
         layout = QHBoxLayout(widget)
 
@@ -180,15 +182,16 @@ class CanvasContextMenu(ContextMenu):
         self.redraw_widgets()
 
     def redraw_widgets(self) -> None:
+        self.setUpdatesEnabled(False)
+
         self.menu_items = []
         self.widgets = []
         self.clear()
 
         annos = self.parent.annotations
-        hidden_annos = [anno for anno in annos if anno.hidden]
 
         text, should_hide = ('Show All', False) \
-            if hidden_annos else ('Hide All', True)
+            if any(anno.hidden for anno in annos) else ('Hide All', True)
 
         def set_hidden_all() -> None:
             for anno in self.parent.annotations:
@@ -206,8 +209,7 @@ class CanvasContextMenu(ContextMenu):
         buttons_widget = QWidget()
         buttons_widget.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
         buttons_widget.installEventFilter(self)
-        buttons_widget.setStyleSheet(
-            str(WidgetStyleSheet(self.background_color)))
+        buttons_widget.setStyleSheet(self.widget_style_sheet)
 
         layout = QHBoxLayout(buttons_widget)
         layout.setContentsMargins(*self.button_margins)
@@ -225,6 +227,8 @@ class CanvasContextMenu(ContextMenu):
             check_box = ContextCheckBox(self.parent, annotation)
             self._add_item(check_box, None)
 
+        self.setUpdatesEnabled(True)
+
     def on_key_press(self, event: QKeyEvent) -> None:
         ctrl_pressed = event.modifiers() & Qt.KeyboardModifier.ControlModifier
         shift_pressed = event.modifiers() & Qt.KeyboardModifier.ShiftModifier
@@ -1,11 +1,12 @@
+from functools import lru_cache
 from typing import Callable, TYPE_CHECKING
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QMouseEvent
 from PyQt6.QtWidgets import QLabel, QCheckBox
 
+from app.enums.annotation import SelectionType
 from app.objects import Annotation
-from app.utils import pretty_text, text_to_color
 from app.styles.style_sheets import LabelStyleSheet, CheckBoxStyleSheet
 
 if TYPE_CHECKING:
@@ -14,6 +15,18 @@ if TYPE_CHECKING:
 __background__ = Qt.WidgetAttribute.WA_TranslucentBackground
 
 
+@lru_cache(maxsize=2)
+def _label_style_sheet(risky: bool) -> str:
+    return str(LabelStyleSheet(risky))
+
+
+@lru_cache(maxsize=256)
+def _checkbox_style_sheet(selected: SelectionType,
+                          checkbox_color: tuple[int, int, int]
+                          ) -> str:
+    return str(CheckBoxStyleSheet(selected, checkbox_color))
+
+
 class ContextMenuItem:
     def on_left_click(self) -> None:
         pass
@@ -47,7 +60,7 @@ class ContextButton(QLabel, ContextMenuItem):
         self.on_left_click = binding
         self.on_right_click = binding
 
-        self.setStyleSheet(str(LabelStyleSheet(risky)))
+        self.setStyleSheet(_label_style_sheet(risky))
 
 
 class ContextCheckBox(QCheckBox, ContextMenuItem):
@@ -93,8 +106,8 @@ class ContextCheckBox(QCheckBox, ContextMenuItem):
 
     def update(self) -> None:
         selected = self.annotation.selected
-        checkbox_color = text_to_color(self.annotation.label_name)
+        checkbox_color = self.annotation.color
 
-        self.setStyleSheet(str(CheckBoxStyleSheet(selected, checkbox_color)))
-        self.setText(pretty_text(self.annotation.label_name))
+        self.setStyleSheet(_checkbox_style_sheet(selected, checkbox_color))
+        self.setText(self.annotation.pretty_name)
         self.setChecked(not self.annotation.hidden)
@@ -26,6 +26,9 @@ class ToolBar(QToolBar):
 
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.PreventContextMenu)
 
+        # Relayout once at the end instead of per added button
+        self.setUpdatesEnabled(False)
+
         for action_name in self.toolbar_actions:
             if action_name == '__separator__':
                 self.addSeparator()
@@ -40,6 +43,9 @@ class ToolBar(QToolBar):
 
             self.addWidget(button)
 
+        self.setUpdatesEnabled(True)
+        self.layout().activate()
+
 
 class ToolButton(QToolButton):
     def sizeHint(self):